@@ -0,0 +1,47 @@
+"""Load the add-on module for benchmarks, inside or outside Blender.
+
+The vertex classification kernels are pure NumPy. When Blender's modules are
+not available, minimal stand-ins are installed so the add-on can be imported
+and those kernels benchmarked with a plain Python interpreter.
+"""
+import os
+import sys
+import types
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+
+def _install_blender_stand_ins():
+    bpy = types.ModuleType("bpy")
+    bpy.types = types.SimpleNamespace(Panel=object, Operator=object)
+    bpy.props = types.ModuleType("bpy.props")
+    for name in ("FloatProperty", "IntProperty", "BoolProperty", "FloatVectorProperty", "StringProperty"):
+        setattr(bpy.props, name, lambda **kwargs: None)
+    bpy.app = types.ModuleType("bpy.app")
+    bpy.app.handlers = types.ModuleType("bpy.app.handlers")
+    bpy.app.handlers.persistent = lambda func: func
+
+    bpy_extras = types.ModuleType("bpy_extras")
+    bpy_extras.object_utils = types.ModuleType("bpy_extras.object_utils")
+    bpy_extras.object_utils.world_to_camera_view = None
+
+    mathutils = types.ModuleType("mathutils")
+    mathutils.Vector = tuple
+
+    sys.modules.update({
+        "bpy": bpy,
+        "bpy.props": bpy.props,
+        "bpy.app": bpy.app,
+        "bpy.app.handlers": bpy.app.handlers,
+        "bpy_extras": bpy_extras,
+        "bpy_extras.object_utils": bpy_extras.object_utils,
+        "mathutils": mathutils,
+    })
+
+
+try:
+    import bpy  # noqa: F401
+except ImportError:
+    _install_blender_stand_ins()
+
+import stylized_hair_stubble as addon  # noqa: E402
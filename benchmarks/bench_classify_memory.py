@@ -0,0 +1,104 @@
+"""Peak memory of vertex classification on a dense synthetic head.
+
+Measures tracemalloc peaks for hair and stubble on two paths:
+
+    classify    classify_vertices() on an existing coordinate array
+    distribute  the full distribute_*_vertices() path: reading coordinates
+                with foreach_get, classifying and writing the density and
+                length vertex groups
+
+Outside Blender, the mesh and vertex groups are minimal stand-ins. The mesh
+coordinates they copy from are allocated before tracing, like Blender's own
+mesh storage, and VertexGroup.add() keeps nothing, so the peaks only show
+the add-on's own allocations.
+
+    python benchmarks/bench_classify_memory.py --vertices 5000000
+"""
+import argparse
+import os
+import tracemalloc
+import types
+
+import numpy as np
+
+from _addon import addon
+
+
+def sphere_points(count, seed=0):
+    """Random points on a unit sphere, as float32 (N, 3) coordinates"""
+    rng = np.random.default_rng(seed)
+    coords = rng.standard_normal((count, 3)).astype(np.float32)
+    coords /= np.linalg.norm(coords, axis=1, keepdims=True)
+    return coords
+
+
+class Vertices:
+    """Mesh vertex collection backed by a coordinate array"""
+
+    def __init__(self, coords):
+        self.coords = coords
+
+    def __len__(self):
+        return len(self.coords)
+
+    def foreach_get(self, attr, buffer):
+        buffer[:] = self.coords.reshape(-1)
+
+
+class VertexGroup:
+    def __init__(self, name):
+        self.name = name
+        self.calls = 0
+
+    def add(self, index, weight, type):
+        self.calls += 1
+
+
+class VertexGroups(dict):
+    def new(self, name):
+        self[name] = VertexGroup(name)
+        return self[name]
+
+    def remove(self, group):
+        del self[group.name]
+
+
+def measure(func):
+    tracemalloc.start()
+    result = func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, peak / 2 ** 20
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--vertices", type=int, default=5_000_000)
+    parser.add_argument("--chunk-size", type=int, default=addon.DEFAULT_CHUNK_SIZE)
+    parser.add_argument("--threads", type=int, default=1)
+    args = parser.parse_args()
+
+    coords = sphere_points(args.vertices)
+    obj = types.SimpleNamespace(data=types.SimpleNamespace(vertices=Vertices(coords)),
+                                vertex_groups=VertexGroups())
+    scene = types.SimpleNamespace(hair_chunk_size=args.chunk_size, hair_threads=args.threads)
+    print(f"vertices={args.vertices} chunk_size={args.chunk_size} threads={args.threads} "
+          f"coords_mb={coords.nbytes / 2 ** 20:.1f}")
+
+    for name, weight_fn, distribute in (("hair", addon.hair_weights, addon.distribute_hair_vertices),
+                                        ("stubble", addon.stubble_weights, addon.distribute_stubble_vertices)):
+        (verts, weights), classify_peak = measure(
+            lambda: addon.classify_vertices(coords, weight_fn, chunk_size=args.chunk_size, threads=args.threads))
+        output = verts.nbytes + weights.nbytes
+        del verts, weights
+
+        _, distribute_peak = measure(lambda: distribute(obj, scene))
+        calls = sum(group.calls for group in obj.vertex_groups.values())
+        obj.vertex_groups.clear()
+
+        print(f"{name:8s} output_mb={output / 2 ** 20:6.1f} classify_peak_mb={classify_peak:6.1f} "
+              f"distribute_peak_mb={distribute_peak:6.1f} vertex_group_adds={calls}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""Thread scaling of vertex classification on a dense synthetic head.
+
+Times classify_vertices() for hair with 1 to 16 worker threads and checks
+that every thread count produces exactly the same result as a single
+thread.
+
+    python benchmarks/bench_classify_threads.py --vertices 5000000
+"""
+import argparse
+import time
+
+import numpy as np
+
+from _addon import addon
+from bench_classify_memory import sphere_points
+
+
+def classify(coords, chunk_size, threads):
+    return addon.classify_vertices(coords, addon.hair_weights, chunk_size=chunk_size, threads=threads)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--vertices", type=int, default=5_000_000)
+    parser.add_argument("--chunk-size", type=int, default=addon.DEFAULT_CHUNK_SIZE)
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 2, 4, 8, 16])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    coords = sphere_points(args.vertices)
+    reference = classify(coords, len(coords), 1)
+    print(f"vertices={args.vertices} chunk_size={args.chunk_size}")
+
+    baseline = None
+    for threads in args.threads:
+        best = float("inf")
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            result = classify(coords, args.chunk_size, threads)
+            best = min(best, time.perf_counter() - start)
+
+        identical = all(np.array_equal(a, b) for a, b in zip(result, reference))
+        baseline = baseline or best
+        print(f"threads={threads:2d} best_ms={best * 1000:8.1f} speedup={baseline / best:5.2f} identical={identical}")
+
+
+if __name__ == "__main__":
+    main()
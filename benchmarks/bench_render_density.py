@@ -0,0 +1,90 @@
+"""Render-time and peak-memory benchmark for camera coverage render density.
+
+Builds a synthetic crowd of heads with hair and stubble, spread out in depth
+in front of the camera, and renders one Cycles frame. Run once per mode, each
+in its own Blender process so peak memory is not shared between runs:
+
+    blender -b --factory-startup --python benchmarks/bench_render_density.py -- --mode off
+    blender -b --factory-startup --python benchmarks/bench_render_density.py -- --mode on
+"""
+import argparse
+import os
+import re
+import resource
+import sys
+import time
+
+import bpy
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+import stylized_hair_stubble
+
+
+def parse_args():
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--mode", choices=("on", "off"), default="on")
+    parser.add_argument("--rows", type=int, default=10, help="Rows of characters going away from the camera")
+    parser.add_argument("--columns", type=int, default=10)
+    parser.add_argument("--spacing", type=float, default=1.5)
+    parser.add_argument("--resolution", type=int, default=960)
+    parser.add_argument("--samples", type=int, default=16)
+    return parser.parse_args(argv)
+
+
+def build_crowd(scene, rows, columns, spacing):
+    """Create a grid of groomed heads, the nearest row right in front of the camera"""
+    for row in range(rows):
+        for column in range(columns):
+            x = (column - (columns - 1) / 2) * spacing
+            bpy.ops.mesh.primitive_uv_sphere_add(segments=48, ring_count=24, radius=0.12,
+                                                 location=(x, 2.0 + row * spacing, 0.0))
+            obj = bpy.context.active_object
+            obj.name = f"Head_{row:02d}_{column:02d}"
+            scene.hair_target_object = obj
+            bpy.ops.object.create_hair(system_type='BOTH')
+
+    bpy.ops.object.camera_add(location=(0.0, -1.0, 0.3), rotation=(1.5, 0.0, 0.0))
+    scene.camera = bpy.context.active_object
+
+
+def main():
+    args = parse_args()
+    bpy.ops.wm.read_factory_settings(use_empty=True)
+    stylized_hair_stubble.register()
+
+    scene = bpy.context.scene
+    scene.render.engine = 'CYCLES'
+    scene.cycles.samples = args.samples
+    scene.render.resolution_x = args.resolution
+    scene.render.resolution_y = args.resolution * 9 // 16
+    scene.render.use_lock_interface = True
+
+    build_crowd(scene, args.rows, args.columns, args.spacing)
+    scene.hair_render_lod = args.mode == "on"
+
+    # Cycles reports its own peak memory in the render stats
+    stats = []
+    bpy.app.handlers.render_stats.append(lambda text, *rest: stats.append(text))
+
+    start = time.perf_counter()
+    bpy.ops.render.render()
+    elapsed = time.perf_counter() - start
+
+    peak = None
+    for text in reversed(stats):
+        match = re.search(r"Peak:? *([0-9.]+ *[KMG]i?B?)", text)
+        if match:
+            peak = match.group(1)
+            break
+
+    # Particle amounts must be back to their originals after the render
+    counts = sorted({p.count for p in bpy.data.particles})
+
+    print(f"mode={args.mode} characters={args.rows * args.columns} render_s={elapsed:.2f} "
+          f"cycles_peak={peak} process_maxrss_mb={resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024:.0f} "
+          f"counts_after={counts}")
+
+
+if __name__ == "__main__":
+    main()
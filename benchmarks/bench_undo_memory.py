@@ -0,0 +1,104 @@
+"""Undo stack memory for slider sweeps on a heavy groomed mesh.
+
+Must run in an interactive Blender session: in background mode there is no
+undo stack, so undo pushes are ignored. The script drives the add-on's real
+live-update path: each tick sets the scene property (which queues the
+debounced update), one undo step is pushed when the "drag" ends as the UI
+does on release, and the debounce timer then writes the particle system.
+Process memory is reported before and after the sweeps, and Blender quits
+when done.
+
+    blender --factory-startup --python benchmarks/bench_undo_memory.py -- --sweeps 10
+"""
+import argparse
+import os
+import resource
+import sys
+
+import bpy
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+import stylized_hair_stubble
+
+
+def parse_args():
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--subdivisions", type=int, default=7, help="Subdivisions of the head mesh")
+    parser.add_argument("--sweeps", type=int, default=10, help="Slider drags, each ending in one undo push")
+    parser.add_argument("--ticks", type=int, default=100, help="Property updates per drag")
+    return parser.parse_args(argv)
+
+
+def resident_mb():
+    """Current resident memory of this process in MB"""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2 ** 20
+    except OSError:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+class Sweep:
+    """Runs the drags from a timer, so the add-on's debounce timer fires in between"""
+
+    def __init__(self, args):
+        self.args = args
+        self.sweep = 0
+        self.before = None
+
+    def setup(self):
+        for obj in list(bpy.data.objects):
+            bpy.data.objects.remove(obj)
+        stylized_hair_stubble.register()
+
+        prefs = bpy.context.preferences.edit
+        prefs.undo_steps = max(prefs.undo_steps, self.args.sweeps + 8)
+        prefs.undo_memory_limit = 0
+
+        bpy.ops.mesh.primitive_ico_sphere_add(subdivisions=self.args.subdivisions, radius=0.12)
+        self.obj = bpy.context.active_object
+        bpy.context.scene.hair_target_object = self.obj
+        bpy.ops.object.create_hair(system_type='BOTH')
+        bpy.ops.ed.undo_push(message="Create Hair")
+
+    def drag(self):
+        scene = bpy.context.scene
+        start, step = (600, 50) if self.sweep % 2 == 0 else (5600, -50)
+        for tick in range(self.args.ticks):
+            scene.hair_density = start + tick * step
+
+        # The UI pushes one undo step when the slider is released
+        bpy.ops.ed.undo_push(message="Hair Density")
+        self.sweep += 1
+
+    def step(self):
+        # Timers run without a window in the context, which the operators need
+        with bpy.context.temp_override(window=bpy.context.window_manager.windows[0]):
+            return self._step()
+
+    def _step(self):
+        if self.before is None:
+            self.setup()
+            self.before = resident_mb()
+        elif self.sweep == self.args.sweeps:
+            after = resident_mb()
+            print(f"vertices={len(self.obj.data.vertices)} sweeps={self.args.sweeps} ticks={self.args.ticks} "
+                  f"rss_before_mb={self.before:.0f} rss_after_mb={after:.0f} "
+                  f"growth_per_sweep_mb={(after - self.before) / self.args.sweeps:.1f}")
+            bpy.ops.wm.quit_blender()
+            return None
+        else:
+            self.drag()
+
+        # Give the debounced live update time to run before the next drag
+        return stylized_hair_stubble.LIVE_UPDATE_DELAY * 4
+
+
+def main():
+    runner = Sweep(parse_args())
+    bpy.app.timers.register(runner.step, first_interval=1.0)
+
+
+if __name__ == "__main__":
+    main()
@@ -8,68 +8,144 @@ bl_info = {
     "category": "Object",
 }
 
+import os
+from concurrent.futures import ThreadPoolExecutor
+
 import bpy
+import numpy as np
+from bpy.app.handlers import persistent
+from bpy_extras.object_utils import world_to_camera_view
+from mathutils import Vector
 from bpy.props import FloatProperty, IntProperty, BoolProperty, FloatVectorProperty, StringProperty
 
-# Property update function to trigger live updates
-def update_hair_settings(self, context):
-    obj = context.active_object
+# Seconds without further property changes before live updates are applied.
+# A slider drag only touches the particle systems and materials once it
+# settles, instead of on every tick.
+LIVE_UPDATE_DELAY = 0.15
+
+# Live updates waiting for the debounce timer ('HAIR', 'STUBBLE', 'TRANSPARENCY')
+_pending_updates = set()
+
+def set_if_changed(data, attr, value):
+    """Assign data.attr only if the value differs, so unchanged data is not tagged for update"""
+    current = getattr(data, attr)
+    if hasattr(current, "__len__"):
+        changed = tuple(current) != tuple(value)
+    else:
+        changed = current != value
+    if changed:
+        setattr(data, attr, value)
+
+def sync_hair_settings(scene, obj):
+    """Apply the scene hair settings to the hair system and material of obj"""
     if obj and obj.type == 'MESH' and obj.particle_systems:
         # Check if we already have the hair systems
-        hair_system = None
         for psys in obj.particle_systems:
             if psys.name == "StylizedHair":
-                hair_system = psys
                 # Update hair system
-                psys.settings.count = self.hair_density
-                psys.settings.hair_length = self.hair_length
+                set_if_changed(psys.settings, "count", scene.hair_density)
+                set_if_changed(psys.settings, "hair_length", scene.hair_length)
                 try:
-                    psys.settings.radius_scale = self.hair_thickness
+                    set_if_changed(psys.settings, "radius_scale", scene.hair_thickness)
                 except:
                     pass
                 
                 # Update hair color and grey percentage
                 for mat in obj.material_slots:
                     if mat.material and mat.material.name.startswith("Hair_Material"):
-                        update_hair_material(mat.material, self.hair_color, self.hair_grey_percentage)
+                        update_hair_material(mat.material, scene.hair_color, scene.hair_grey_percentage)
                         break
 
-def update_stubble_settings(self, context):
-    obj = context.active_object
+def sync_stubble_settings(scene, obj):
+    """Apply the scene stubble settings to the stubble system and material of obj"""
     if obj and obj.type == 'MESH' and obj.particle_systems:
         # Check if we already have the stubble system
-        stubble_system = None
         for psys in obj.particle_systems:
             if psys.name == "StylizedStubble":
-                stubble_system = psys
                 # Update stubble system
-                psys.settings.count = self.stubble_density
-                psys.settings.hair_length = self.stubble_length
+                set_if_changed(psys.settings, "count", scene.stubble_density)
+                set_if_changed(psys.settings, "hair_length", scene.stubble_length)
                 try:
-                    psys.settings.radius_scale = self.stubble_thickness
+                    set_if_changed(psys.settings, "radius_scale", scene.stubble_thickness)
                 except:
                     pass
                 
                 # Update stubble color and grey percentage
                 for mat in obj.material_slots:
                     if mat.material and mat.material.name.startswith("Stubble_Material"):
-                        update_stubble_material(mat.material, self.stubble_color, self.stubble_grey_percentage)
+                        update_stubble_material(mat.material, scene.stubble_color, scene.stubble_grey_percentage)
                         break
 
-def update_transparency_settings(self, context):
-    obj = context.active_object
+def sync_transparency_settings(scene, obj):
+    """Apply the scene transparency settings to the hair and stubble materials of obj"""
     if obj and obj.type == 'MESH':
         # Update transparency for all relevant materials
         for mat_slot in obj.material_slots:
             if mat_slot.material and (mat_slot.material.name.startswith("Hair_Material") or 
                                       mat_slot.material.name.startswith("Stubble_Material")):
-                update_material_transparency(mat_slot.material, self.transparent_scalp, self.scalp_opacity)
+                update_material_transparency(mat_slot.material, scene.transparent_scalp, scene.scalp_opacity)
+
+def apply_live_updates():
+    """Timer callback: apply all pending live updates to the active object"""
+    scene = bpy.context.scene
+    obj = bpy.context.view_layer.objects.active
+    
+    if 'HAIR' in _pending_updates:
+        sync_hair_settings(scene, obj)
+    if 'STUBBLE' in _pending_updates:
+        sync_stubble_settings(scene, obj)
+    if 'TRANSPARENCY' in _pending_updates:
+        sync_transparency_settings(scene, obj)
+    
+    _pending_updates.clear()
+    return None
+
+def schedule_live_update(kind):
+    """Queue a live update, restarting the debounce timer"""
+    _pending_updates.add(kind)
+    if bpy.app.timers.is_registered(apply_live_updates):
+        bpy.app.timers.unregister(apply_live_updates)
+    bpy.app.timers.register(apply_live_updates, first_interval=LIVE_UPDATE_DELAY)
+
+@persistent
+def sync_after_undo(scene, *args):
+    """Bring particle systems and materials back in line with the scene settings after undo/redo
+    
+    Live updates are written after Blender has pushed the undo step for a
+    slider drag, so a restored step can hold the new setting with the old
+    particle data. The sync functions only write values that differ, so
+    consistent steps are left untouched.
+    """
+    obj = bpy.context.view_layer.objects.active
+    sync_hair_settings(scene, obj)
+    sync_stubble_settings(scene, obj)
+    sync_transparency_settings(scene, obj)
+
+# Property update functions to trigger live updates
+def update_hair_settings(self, context):
+    schedule_live_update('HAIR')
+
+def update_stubble_settings(self, context):
+    schedule_live_update('STUBBLE')
+
+def update_transparency_settings(self, context):
+    schedule_live_update('TRANSPARENCY')
+
+def is_linked_from(socket, node):
+    """Check whether socket is fed by node"""
+    return any(link.from_node == node for link in socket.links)
 
 def update_material_transparency(material, make_transparent, opacity=0.0):
     """Update material transparency setting with custom opacity"""
     if not material or not material.use_nodes:
         return
     
+    # Materials using the shared shader group handle transparency inside the group
+    shader = find_hair_shader_node(material)
+    if shader:
+        set_if_changed(shader.inputs["Opacity"], "default_value", 0.0 if make_transparent else opacity)
+        return
+    
     nodes = material.node_tree.nodes
     links = material.node_tree.links
     
@@ -101,24 +177,26 @@ def update_material_transparency(material, make_transparent, opacity=0.0):
             transparent_node.location = (100, -100)
         
         if principled_node and mix_node and transparent_node and output_node:
-            # Clear existing links to output
-            for link in output_node.inputs[0].links:
-                links.remove(link)
-            
-            # Connect mix shader
-            links.new(transparent_node.outputs[0], mix_node.inputs[1])
-            links.new(principled_node.outputs[0], mix_node.inputs[2])
-            links.new(mix_node.outputs[0], output_node.inputs[0])
+            # Relink only if the mix shader isn't already driving the output
+            if not is_linked_from(output_node.inputs[0], mix_node):
+                # Clear existing links to output
+                for link in output_node.inputs[0].links:
+                    links.remove(link)
+                
+                # Connect mix shader
+                links.new(transparent_node.outputs[0], mix_node.inputs[1])
+                links.new(principled_node.outputs[0], mix_node.inputs[2])
+                links.new(mix_node.outputs[0], output_node.inputs[0])
             
             # Set factor - when fully transparent (opacity=0), factor should be 1
             # When fully opaque (opacity=1), factor should be 0
             if make_transparent:
-                mix_node.inputs[0].default_value = 1.0
+                set_if_changed(mix_node.inputs[0], "default_value", 1.0)
             else:
-                mix_node.inputs[0].default_value = 1.0 - opacity
+                set_if_changed(mix_node.inputs[0], "default_value", 1.0 - opacity)
     else:
         # If we want scalp fully visible, connect principled directly to output
-        if principled_node and output_node:
+        if principled_node and output_node and not is_linked_from(output_node.inputs[0], principled_node):
             # Clear existing links to output
             for link in output_node.inputs[0].links:
                 links.remove(link)
@@ -131,6 +209,14 @@ def update_hair_material(material, color, grey_percentage):
     if not material or not material.use_nodes:
         return
     
+    # Materials using the shared shader group only need their group inputs updated
+    shader = find_hair_shader_node(material)
+    if shader:
+        set_if_changed(shader.inputs["Color"], "default_value", color)
+        set_if_changed(shader.inputs["Grey Amount"], "default_value", grey_percentage / 100.0)
+        set_if_changed(shader.inputs["Noise Scale"], "default_value", grey_noise_scale(grey_percentage))
+        return
+    
     nodes = material.node_tree.nodes
     
     # Find color ramp for gray adjustment
@@ -157,11 +243,7 @@ def update_hair_material(material, color, grey_percentage):
             break
     
     if noise_node:
-        # More grey = smaller noise scale (more variation)
-        if grey_percentage > 50:
-            noise_node.inputs['Scale'].default_value = 20.0 - (grey_percentage * 0.1)
-        else:
-            noise_node.inputs['Scale'].default_value = 12.0
+        noise_node.inputs['Scale'].default_value = grey_noise_scale(grey_percentage)
 
 def update_stubble_material(material, color, grey_percentage):
     """Update the stubble material with specified color and grey percentage"""
@@ -242,6 +324,25 @@ class HAIR_PT_Panel(bpy.types.Panel):
         row.operator("object.create_hair", text="Create Both Hair & Stubble").system_type = 'BOTH'
         row = layout.row()
         row.operator("object.remove_hair", text="Remove All").system_type = 'BOTH'
+        
+        # Performance settings for dense meshes
+        layout.separator()
+        box = layout.box()
+        box.label(text="Performance")
+        box.prop(scene, "hair_chunk_size")
+        box.prop(scene, "hair_threads")
+        
+        # Camera distance based render density
+        box = layout.box()
+        box.label(text="Render Density")
+        box.prop(scene, "hair_render_lod")
+        if scene.hair_render_lod and not scene.render.use_lock_interface:
+            box.label(text="Needs Render > Lock Interface", icon='ERROR')
+        col = box.column()
+        col.active = scene.hair_render_lod
+        col.prop(scene, "hair_lod_full_coverage")
+        col.prop(scene, "hair_lod_min_factor")
+        col.prop(scene, "stubble_lod_cutoff")
 
 # Operator to create hair/stubble
 class HAIR_OT_Create(bpy.types.Operator):
@@ -292,25 +393,25 @@ class HAIR_OT_Remove(bpy.types.Operator):
             obj = context.active_object
         
         if obj and obj.type == 'MESH':
-            # Remove particle systems based on type
-            if self.system_type == 'BOTH':
-                # Remove all particle systems
-                while obj.particle_systems:
-                    bpy.context.view_layer.objects.active = obj
-                    bpy.ops.object.particle_system_remove()
-            else:
-                systems_to_remove = []
-                for i, psys in enumerate(obj.particle_systems):
-                    if (self.system_type == 'HAIR' and psys.name == "StylizedHair") or \
-                       (self.system_type == 'STUBBLE' and psys.name == "StylizedStubble"):
-                        systems_to_remove.append(i)
-                
-                # Remove in reverse order to avoid index shifting
-                bpy.context.view_layer.objects.active = obj
-                for i in sorted(systems_to_remove, reverse=True):
-                    obj.particle_systems.active_index = i
-                    bpy.ops.object.particle_system_remove()
+            # Make sure we're in object mode
+            if context.mode != 'OBJECT':
+                bpy.ops.object.mode_set(mode='OBJECT')
             
+            # Remove only the addon's systems and everything created with them
+            removed = {"systems": 0, "datablocks": 0, "slots": 0, "vertex_groups": 0, "shared_meshes": 0}
+            for system_type in SYSTEM_DATA:
+                if self.system_type in (system_type, 'BOTH'):
+                    for key, count in remove_hair_data(obj, system_type).items():
+                        removed[key] += count
+            
+            # Single depsgraph update for all removals
+            context.view_layer.update()
+            
+            self.report({'INFO'}, "Removed {systems} particle systems, reclaimed {datablocks} datablocks, "
+                                  "{slots} material slots and {vertex_groups} vertex groups".format(**removed))
+            if removed["shared_meshes"]:
+                self.report({'WARNING'}, f"Mesh '{obj.data.name}' is shared with other objects, "
+                                         "its material slots and vertex groups were kept")
             return {'FINISHED'}
         else:
             self.report({'ERROR'}, "Select or specify a mesh object first")
@@ -343,9 +444,162 @@ class HAIR_OT_UpdateTransparency(bpy.types.Operator):
             self.report({'ERROR'}, "Select or specify a mesh object first")
             return {'CANCELLED'}
 
+# Name of the node group shared by all hair and stubble materials
+HAIR_SHADER_GROUP = "StylizedHair_Shader"
+
+# Custom property marking materials created by the addon, set to the base
+# material name ("Hair_Material" or "Stubble_Material")
+MATERIAL_TAG = "stylized_hair_material"
+
+# Bumped whenever the node group layout changes, so groups saved by older
+# versions are rebuilt in place
+HAIR_SHADER_GROUP_VERSION = 2
+
+# Grey Amount -> noise threshold. The Noise Texture Fac (Detail 1, Roughness
+# 0.5) is not uniform: it stays within about 0.12-0.89 with most values near
+# 0.5. These are its upper quantiles, estimated with a NumPy re-implementation
+# of the noise, so that a Grey Amount of p turns roughly p of the hair grey.
+GREY_THRESHOLDS = (
+    (0.0, 1.0), (0.05, 0.662), (0.1, 0.628), (0.2, 0.586), (0.3, 0.554), (0.5, 0.501),
+    (0.7, 0.446), (0.8, 0.414), (0.9, 0.37), (0.95, 0.336), (1.0, 0.0),
+)
+
+# Default grey/salt color mixed into the base color
+GREY_COLOR = (0.7, 0.68, 0.66, 1.0)
+
+def grey_noise_scale(grey_percentage):
+    """Noise scale for the grey pattern: more grey = smaller noise scale (more variation)"""
+    if grey_percentage > 50:
+        return 20.0 - (grey_percentage * 0.1)
+    return 12.0
+
+def find_socket(sockets, name, socket_type):
+    """Find a socket by name and type, for nodes like Mix that have one A/B/Result per data type"""
+    return next(socket for socket in sockets if socket.name == name and socket.type == socket_type)
+
+def get_hair_shader_group():
+    """Get or create the shared shader node group used by hair and stubble materials"""
+    group = bpy.data.node_groups.get(HAIR_SHADER_GROUP)
+    if group and group.get("version") == HAIR_SHADER_GROUP_VERSION:
+        return group
+    
+    # Rebuild outdated groups in place, so existing materials pick up the new layout
+    if group:
+        group.nodes.clear()
+        group.interface.clear()
+    else:
+        group = bpy.data.node_groups.new(name=HAIR_SHADER_GROUP, type='ShaderNodeTree')
+    group["version"] = HAIR_SHADER_GROUP_VERSION
+    nodes = group.nodes
+    links = group.links
+    
+    # Group inputs and output
+    socket = group.interface.new_socket(name="Color", in_out='INPUT', socket_type='NodeSocketColor')
+    socket.default_value = (0.09, 0.04, 0.02, 1.0)
+    socket = group.interface.new_socket(name="Grey Color", in_out='INPUT', socket_type='NodeSocketColor')
+    socket.default_value = GREY_COLOR
+    socket = group.interface.new_socket(name="Grey Amount", in_out='INPUT', socket_type='NodeSocketFloat')
+    socket.default_value = 0.2
+    socket.min_value = 0.0
+    socket.max_value = 1.0
+    socket = group.interface.new_socket(name="Noise Scale", in_out='INPUT', socket_type='NodeSocketFloat')
+    socket.default_value = 12.0
+    socket.min_value = 0.0
+    socket = group.interface.new_socket(name="Opacity", in_out='INPUT', socket_type='NodeSocketFloat')
+    socket.default_value = 1.0
+    socket.min_value = 0.0
+    socket.max_value = 1.0
+    group.interface.new_socket(name="Shader", in_out='OUTPUT', socket_type='NodeSocketShader')
+    
+    group_in = nodes.new(type='NodeGroupInput')
+    group_in.location = (-800, 0)
+    group_out = nodes.new(type='NodeGroupOutput')
+    group_out.location = (600, 0)
+    
+    # Color variation: noise above a threshold set by the grey amount turns grey
+    noise = nodes.new(type='ShaderNodeTexNoise')
+    noise.location = (-600, 200)
+    noise.inputs['Detail'].default_value = 1.0
+    links.new(group_in.outputs["Noise Scale"], noise.inputs['Scale'])
+    
+    # Calibrated threshold for the grey amount, with straight segments between points
+    threshold = nodes.new(type='ShaderNodeFloatCurve')
+    threshold.location = (-600, -100)
+    curve = threshold.mapping.curves[0]
+    curve.points[0].location = GREY_THRESHOLDS[0]
+    curve.points[1].location = GREY_THRESHOLDS[-1]
+    for location in GREY_THRESHOLDS[1:-1]:
+        curve.points.new(*location)
+    for point in curve.points:
+        point.handle_type = 'VECTOR'
+    threshold.mapping.update()
+    links.new(group_in.outputs["Grey Amount"], threshold.inputs['Value'])
+    
+    # Narrow band around the threshold keeps grey strands soft-edged without changing the amount
+    threshold_low = nodes.new(type='ShaderNodeMath')
+    threshold_low.operation = 'SUBTRACT'
+    threshold_low.location = (-400, -50)
+    threshold_low.inputs[1].default_value = 0.01
+    links.new(threshold.outputs['Value'], threshold_low.inputs[0])
+    
+    threshold_high = nodes.new(type='ShaderNodeMath')
+    threshold_high.operation = 'ADD'
+    threshold_high.location = (-400, -200)
+    threshold_high.inputs[1].default_value = 0.01
+    links.new(threshold.outputs['Value'], threshold_high.inputs[0])
+    
+    grey_factor = nodes.new(type='ShaderNodeMapRange')
+    grey_factor.interpolation_type = 'SMOOTHSTEP'
+    grey_factor.location = (-200, 100)
+    links.new(noise.outputs['Fac'], grey_factor.inputs['Value'])
+    links.new(threshold_low.outputs[0], grey_factor.inputs['From Min'])
+    links.new(threshold_high.outputs[0], grey_factor.inputs['From Max'])
+    
+    # Mix base and grey color
+    mix_color = nodes.new(type='ShaderNodeMix')
+    mix_color.data_type = 'RGBA'
+    mix_color.location = (0, 100)
+    links.new(grey_factor.outputs['Result'], find_socket(mix_color.inputs, "Factor", 'VALUE'))
+    links.new(group_in.outputs["Color"], find_socket(mix_color.inputs, "A", 'RGBA'))
+    links.new(group_in.outputs["Grey Color"], find_socket(mix_color.inputs, "B", 'RGBA'))
+    
+    principled = nodes.new(type='ShaderNodeBsdfPrincipled')
+    principled.location = (200, 100)
+    links.new(find_socket(mix_color.outputs, "Result", 'RGBA'), principled.inputs['Base Color'])
+    
+    # Opacity: mix factor is 1 when fully transparent and 0 when fully opaque
+    transparent = nodes.new(type='ShaderNodeBsdfTransparent')
+    transparent.location = (200, -150)
+    
+    inverse_opacity = nodes.new(type='ShaderNodeMath')
+    inverse_opacity.operation = 'SUBTRACT'
+    inverse_opacity.location = (200, -250)
+    inverse_opacity.inputs[0].default_value = 1.0
+    links.new(group_in.outputs["Opacity"], inverse_opacity.inputs[1])
+    
+    mix_shader = nodes.new(type='ShaderNodeMixShader')
+    mix_shader.location = (400, 0)
+    links.new(inverse_opacity.outputs[0], mix_shader.inputs[0])
+    links.new(transparent.outputs[0], mix_shader.inputs[1])
+    links.new(principled.outputs[0], mix_shader.inputs[2])
+    links.new(mix_shader.outputs[0], group_out.inputs["Shader"])
+    
+    return group
+
+def find_hair_shader_node(material):
+    """Return the shared shader group node of a material, if it has one"""
+    if not material or not material.use_nodes:
+        return None
+    
+    for node in material.node_tree.nodes:
+        if node.type == 'GROUP' and node.node_tree and node.node_tree.name == HAIR_SHADER_GROUP:
+            return node
+    return None
+
 def create_hair_material(name="Hair_Material", color=None, grey_percentage=20):
-    """Create a material for stylized hair"""
+    """Create a material for stylized hair as an instance of the shared shader group"""
     mat = bpy.data.materials.new(name=name)
+    mat[MATERIAL_TAG] = name
     mat.use_nodes = True
     nodes = mat.node_tree.nodes
     links = mat.node_tree.links
@@ -354,42 +608,25 @@ def create_hair_material(name="Hair_Material", color=None, grey_percentage=20):
     for node in nodes:
         nodes.remove(node)
     
-    # Create basic shader
+    # Output driven by the shared shader group
     output = nodes.new(type='ShaderNodeOutputMaterial')
-    principled = nodes.new(type='ShaderNodeBsdfPrincipled')
-    
-    # Set up basic connections
-    links.new(principled.outputs[0], output.inputs[0])
+    output.location = (200, 0)
+    shader = nodes.new(type='ShaderNodeGroup')
+    shader.node_tree = get_hair_shader_group()
+    links.new(shader.outputs[0], output.inputs[0])
     
     # Use provided color or default
     if color is None:
         color = (0.09, 0.04, 0.02, 1.0)
     
-    principled.inputs[0].default_value = color
-    
-    # Add color variation
-    noise = nodes.new(type='ShaderNodeTexNoise')
-    colorramp = nodes.new(type='ShaderNodeValToRGB')
-    
-    # Base color and grey variation
-    colorramp.color_ramp.elements[0].color = color
-    colorramp.color_ramp.elements[1].color = (0.7, 0.68, 0.66, 1.0)  # Grey/salt color
-    
-    # Adjust noise scale based on grey percentage
-    if grey_percentage > 50:
-        noise.inputs['Scale'].default_value = 20.0 - (grey_percentage * 0.1)
-    else:
-        noise.inputs['Scale'].default_value = 12.0
-    
-    noise.inputs['Detail'].default_value = 1.0
-    
-    # Connect nodes
-    links.new(noise.outputs[0], colorramp.inputs[0])
-    links.new(colorramp.outputs[0], principled.inputs[0])
+    shader.inputs["Color"].default_value = color
+    shader.inputs["Grey Color"].default_value = GREY_COLOR
+    shader.inputs["Grey Amount"].default_value = grey_percentage / 100.0
+    shader.inputs["Noise Scale"].default_value = grey_noise_scale(grey_percentage)
     
     return mat
 
-def create_hair_system(obj, name="StylizedHair", density=600, length=0.015, thickness=0.05, vertex_group=None, grey_group=None):
+def create_hair_system(obj, name="StylizedHair", density=600, length=0.015, thickness=0.05, vertex_group=None, length_group=None):
     """Create a particle system for hair/stubble that properly attaches to the mesh"""
     # Ensure active object
     bpy.context.view_layer.objects.active = obj
@@ -458,10 +695,10 @@ def create_hair_system(obj, name="StylizedHair", density=600, length=0.015, thic
         except:
             pass
     
-    # Try to set vertex group for grey hairs
-    if grey_group and grey_group in obj.vertex_groups:
+    # Try to set vertex group for length falloff
+    if length_group and length_group in obj.vertex_groups:
         try:
-            psys.vertex_group_length = grey_group
+            psys.vertex_group_length = length_group
         except:
             pass
     
@@ -470,92 +707,266 @@ def create_hair_system(obj, name="StylizedHair", density=600, length=0.015, thic
     
     return psys
 
-def create_vertex_group(obj, name, verts_indices, weights=None):
-    """Create or update a vertex group with given vertices"""
-    # Get or create vertex group
-    if name not in obj.vertex_groups:
-        vgroup = obj.vertex_groups.new(name=name)
-    else:
-        vgroup = obj.vertex_groups[name]
+# Number of discrete weight levels used when writing falloff maps. Vertices
+# sharing a level are written with a single VertexGroup.add() call.
+WEIGHT_LEVELS = 64
+
+# Default number of vertices processed per chunk by the thread pool
+DEFAULT_CHUNK_SIZE = 262144
+
+def smoothstep(edge0, edge1, x):
+    """Hermite smoothstep of x between edge0 and edge1 (works on arrays)"""
+    t = np.clip((x - edge0) / (edge1 - edge0), 0.0, 1.0)
+    return t * t * (3.0 - 2.0 * t)
+
+def read_vertex_coords(mesh):
+    """Read all vertex coordinates of a mesh into an (N, 3) float32 array"""
+    coords = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", coords)
+    return coords.reshape(-1, 3)
+
+def run_chunked(kernel, coords, chunk_size=None, threads=None):
+    """Run kernel(chunk, offset) over fixed-size chunks of coords on a thread pool
+    
+    NumPy releases the GIL inside its array kernels, so chunks are processed
+    concurrently. Results are returned in chunk order.
+    """
+    chunk_size = max(1, chunk_size or DEFAULT_CHUNK_SIZE)
+    offsets = range(0, len(coords), chunk_size)
+    cores = os.cpu_count() or 1
+    threads = min(threads or cores, cores)
+    
+    if threads == 1 or len(offsets) <= 1:
+        return [kernel(coords[o:o + chunk_size], o) for o in offsets]
+    
+    with ThreadPoolExecutor(max_workers=min(threads, len(offsets))) as pool:
+        return list(pool.map(lambda o: kernel(coords[o:o + chunk_size], o), offsets))
+
+def coord_bounds(coords, chunk_size=None, threads=None):
+    """Per-axis minimum and maximum of the coordinates, reduced over chunks"""
+    if len(coords) == 0:
+        return np.zeros(3, dtype=np.float32), np.zeros(3, dtype=np.float32)
+    
+    def _bounds(chunk, offset):
+        return chunk.min(axis=0), chunk.max(axis=0)
+    
+    results = run_chunked(_bounds, coords, chunk_size, threads)
+    lo = np.min([r[0] for r in results], axis=0)
+    hi = np.max([r[1] for r in results], axis=0)
+    return lo, hi
+
+def normalize_coords(coords, lo, hi):
+    """Return normalized height (0 at bottom, 1 at top) and x/y in -1..1"""
+    # Flat axes sit in the middle
+    span = hi - lo
+    unit = np.where(span > 0, (coords - lo) / np.where(span > 0, span, 1.0), 0.5)
+    
+    height = unit[:, 2]
+    side = unit[:, 0] * 2.0 - 1.0
+    front = unit[:, 1] * 2.0 - 1.0
+    return height, side, front
+
+def hair_weights(coords, lo, hi):
+    """Continuous hair density weights with hairline, sideburn and neckline falloff"""
+    height, side, front = normalize_coords(coords, lo, hi)
+    
+    # Soft hairline around the middle of the head instead of a hard cut
+    hairline = smoothstep(0.45, 0.6, height)
+    
+    # Sideburns: hair continues down the sides of the head towards the stubble
+    sideburn = smoothstep(0.55, 0.85, np.abs(side)) * smoothstep(0.3, 0.45, height)
+    
+    # Neckline: hair reaches lower at the back and fades out towards the neck
+    neckline = smoothstep(0.0, -0.5, front) * smoothstep(0.25, 0.45, height)
+    
+    return np.maximum(hairline, np.maximum(sideburn, neckline)).astype(np.float32)
+
+def stubble_weights(coords, lo, hi):
+    """Continuous stubble density weights on the lower front of the face"""
+    height, side, front = normalize_coords(coords, lo, hi)
     
-    # Clear existing assignments
-    vgroup.remove(range(len(obj.data.vertices)))
+    # Stubble on the front of the face, fading out towards the ears
+    facing = smoothstep(-0.1, 0.15, front)
+    
+    # Fade out under the jaw towards the neck
+    neck_fade = smoothstep(0.2, 0.28, height)
+    
+    # Upper edge is soft and reaches higher at the sides to blend into sideburns
+    top = 0.45 + 0.08 * smoothstep(0.5, 0.85, np.abs(side))
+    upper_fade = 1.0 - smoothstep(top - 0.06, top, height)
+    
+    return (facing * neck_fade * upper_fade).astype(np.float32)
+
+def length_weights(density_weights, minimum=0.35):
+    """Length map derived from density: strands get shorter towards the edges"""
+    return np.where(density_weights > 0.0, minimum + (1.0 - minimum) * density_weights, 0.0).astype(np.float32)
+
+def create_vertex_group(obj, name, verts_indices, weights=None, remap=None, chunk_size=None):
+    """Create or update a vertex group with given vertices
+    
+    Weights are quantized to WEIGHT_LEVELS and written in chunks of members,
+    one batched VertexGroup.add() call per level present in a chunk. Index
+    arrays are passed to Blender as they are, without building Python lists.
+    remap, if given, is applied to each chunk of weights before quantizing.
+    """
+    # Recreate the group instead of clearing every vertex of the mesh
+    if name in obj.vertex_groups:
+        obj.vertex_groups.remove(obj.vertex_groups[name])
+    vgroup = obj.vertex_groups.new(name=name)
+    
+    verts_indices = np.asarray(verts_indices, dtype=np.uint32)
+    if len(verts_indices) == 0:
+        return vgroup.name
     
     # Add new vertex assignments
-    if weights:
-        for i, (v_idx, weight) in enumerate(zip(verts_indices, weights)):
-            vgroup.add([v_idx], weight, 'REPLACE')
-    else:
+    if weights is None:
         vgroup.add(verts_indices, 1.0, 'REPLACE')
+        return vgroup.name
+    
+    chunk_size = max(1, chunk_size or DEFAULT_CHUNK_SIZE)
+    for start in range(0, len(verts_indices), chunk_size):
+        chunk_weights = weights[start:start + chunk_size]
+        if remap:
+            chunk_weights = remap(chunk_weights)
+        levels = np.rint(np.clip(chunk_weights, 0.0, 1.0) * WEIGHT_LEVELS).astype(np.uint8)
+        chunk_verts = verts_indices[start:start + chunk_size]
+        for level in np.flatnonzero(np.bincount(levels, minlength=WEIGHT_LEVELS + 1)):
+            if level > 0:
+                vgroup.add(chunk_verts[levels == level], float(level) / WEIGHT_LEVELS, 'REPLACE')
     
     return vgroup.name
 
+def classify_vertices(coords, weight_fn, chunk_size=None, threads=None):
+    """Compute region weights for all vertices in parallel chunks
+    
+    Returns the uint32 indices of vertices with a non-zero weight and their
+    weights. Results are merged in chunk order, so the output does not depend
+    on the number of threads. Per-chunk working arrays are bounded by the
+    chunk size; only region members are kept for the output.
+    """
+    lo, hi = coord_bounds(coords, chunk_size, threads)
+    
+    def _classify(chunk, offset):
+        weights = weight_fn(chunk, lo, hi)
+        verts = np.flatnonzero(weights > 0.0)
+        return (verts + offset).astype(np.uint32), weights[verts]
+    
+    results = run_chunked(_classify, coords, chunk_size, threads)
+    if not results:
+        return np.empty(0, dtype=np.uint32), np.empty(0, dtype=np.float32)
+    
+    verts = np.concatenate([r[0] for r in results])
+    weights = np.concatenate([r[1] for r in results])
+    return verts, weights
+
 def distribute_hair_vertices(obj, scene):
-    """Determine vertices for hair and grey pattern"""
-    # Get mesh dimensions
-    z_coords = [v.co.z for v in obj.data.vertices]
-    min_z, max_z = min(z_coords), max(z_coords)
-    
-    # Collect hair vertices
-    hair_verts = []
-    grey_hair_verts = []
-    
-    # Calculate which vertices to use for hair
-    for i, v in enumerate(obj.data.vertices):
-        # Calculate height factor (0 at bottom, 1 at top)
-        if max_z > min_z:
-            height = (v.co.z - min_z) / (max_z - min_z)
-        else:
-            height = 0.5
-        
-        # Hair on top half of head
-        if height > 0.5:
-            hair_verts.append(i)
-            
-            # Grey hair pattern
-            grey_factor = (v.co.x * 5 + v.co.y * 7 + v.co.z * 11) % 100
-            if grey_factor < scene.hair_grey_percentage:
-                grey_hair_verts.append(i)
+    """Compute hair density and length weight maps"""
+    coords = read_vertex_coords(obj.data)
+    
+    # Falloff weights for hairline, sideburns and neckline
+    hair_verts, weights = classify_vertices(
+        coords, hair_weights,
+        chunk_size=scene.hair_chunk_size, threads=scene.hair_threads
+    )
     
     # Create vertex groups
-    hair_group = create_vertex_group(obj, "Hair_Vertex_Group", hair_verts)
-    grey_hair_group = create_vertex_group(obj, "Grey_Hair_Group", grey_hair_verts)
+    hair_group = create_vertex_group(obj, "Hair_Vertex_Group", hair_verts, weights, chunk_size=scene.hair_chunk_size)
+    length_group = create_vertex_group(obj, "Hair_Length_Group", hair_verts, weights, remap=length_weights, chunk_size=scene.hair_chunk_size)
     
-    return hair_group, grey_hair_group
+    return hair_group, length_group
 
 def distribute_stubble_vertices(obj, scene):
-    """Determine vertices for stubble and grey pattern"""
-    # Get mesh dimensions
-    z_coords = [v.co.z for v in obj.data.vertices]
-    y_coords = [v.co.y for v in obj.data.vertices]
-    min_z, max_z = min(z_coords), max(z_coords)
-    
-    # Collect stubble vertices
-    stubble_verts = []
-    grey_stubble_verts = []
-    
-    # Calculate which vertices to use for stubble
-    for i, v in enumerate(obj.data.vertices):
-        # Calculate height factor (0 at bottom, 1 at top)
-        if max_z > min_z:
-            height = (v.co.z - min_z) / (max_z - min_z)
-        else:
-            height = 0.5
-        
-        # Stubble on lower face (front part of head)
-        if v.co.y > 0 and 0.2 < height < 0.5:
-            stubble_verts.append(i)
-            
-            # Grey stubble pattern (different seed than hair)
-            grey_factor = (v.co.x * 7 + v.co.y * 5 + v.co.z * 13) % 100
-            if grey_factor < scene.stubble_grey_percentage:
-                grey_stubble_verts.append(i)
+    """Compute stubble density and length weight maps"""
+    coords = read_vertex_coords(obj.data)
+    
+    # Falloff weights for the beard area, blending into sideburns and neck
+    stubble_verts, weights = classify_vertices(
+        coords, stubble_weights,
+        chunk_size=scene.hair_chunk_size, threads=scene.hair_threads
+    )
     
     # Create vertex groups
-    stubble_group = create_vertex_group(obj, "Stubble_Vertex_Group", stubble_verts)
-    grey_stubble_group = create_vertex_group(obj, "Grey_Stubble_Group", grey_stubble_verts)
+    stubble_group = create_vertex_group(obj, "Stubble_Vertex_Group", stubble_verts, weights, chunk_size=scene.hair_chunk_size)
+    length_group = create_vertex_group(obj, "Stubble_Length_Group", stubble_verts, weights, remap=length_weights, chunk_size=scene.hair_chunk_size)
     
-    return stubble_group, grey_stubble_group
+    return stubble_group, length_group
+
+# Data created by the addon for each system type. The grey groups are no
+# longer created but are still purged from files made by older versions.
+SYSTEM_DATA = {
+    'HAIR': {
+        "system": "StylizedHair",
+        "material": "Hair_Material",
+        "vertex_groups": ("Hair_Vertex_Group", "Grey_Hair_Group", "Hair_Length_Group"),
+    },
+    'STUBBLE': {
+        "system": "StylizedStubble",
+        "material": "Stubble_Material",
+        "vertex_groups": ("Stubble_Vertex_Group", "Grey_Stubble_Group", "Stubble_Length_Group"),
+    },
+}
+
+def remove_hair_data(obj, system_type):
+    """Remove a hair or stubble system and purge its settings, materials, slots and vertex groups
+    
+    Uses the data API instead of operators, so nothing depends on the active
+    object and no depsgraph update is triggered per removal. Returns counts of
+    what was removed.
+    
+    Only materials tagged by create_hair_material count as the addon's. Slots
+    and vertex groups live on the mesh, so they are left alone when the mesh
+    is shared with other objects (counted in "shared_meshes").
+    """
+    data = SYSTEM_DATA[system_type]
+    removed = {"systems": 0, "datablocks": 0, "slots": 0, "vertex_groups": 0, "shared_meshes": 0}
+    
+    # Particle system modifiers owned by the addon
+    settings = []
+    for mod in [m for m in obj.modifiers if m.type == 'PARTICLE_SYSTEM']:
+        if mod.particle_system.name == data["system"]:
+            settings.append(mod.particle_system.settings)
+            obj.modifiers.remove(mod)
+            removed["systems"] += 1
+    
+    # Particle settings no longer used by any system
+    for part in settings:
+        if part and part.users == 0:
+            bpy.data.particles.remove(part)
+            removed["datablocks"] += 1
+    
+    # Slots and vertex groups are mesh data, removing them would affect every user of the mesh
+    if obj.data.users > 1:
+        removed["shared_meshes"] += 1
+        return removed
+    
+    # Material slots holding the addon's materials (reverse order to avoid index shifting)
+    materials = []
+    for i in reversed(range(len(obj.material_slots))):
+        mat = obj.material_slots[i].material
+        if mat and mat.get(MATERIAL_TAG) == data["material"] and obj.material_slots[i].link == 'DATA':
+            materials.append(mat)
+            obj.data.materials.pop(index=i)
+            removed["slots"] += 1
+    
+    # Materials that became orphans, and the shared shader group once unused
+    for mat in materials:
+        if mat.users == 0:
+            bpy.data.materials.remove(mat)
+            removed["datablocks"] += 1
+    
+    group = bpy.data.node_groups.get(HAIR_SHADER_GROUP)
+    if materials and group and group.users == 0:
+        bpy.data.node_groups.remove(group)
+        removed["datablocks"] += 1
+    
+    # Weight maps
+    for name in data["vertex_groups"]:
+        vgroup = obj.vertex_groups.get(name)
+        if vgroup:
+            obj.vertex_groups.remove(vgroup)
+            removed["vertex_groups"] += 1
+    
+    return removed
 
 def create_hair_system_on_object(obj, scene):
     """Create just the hair system on the object"""
@@ -567,12 +978,8 @@ def create_hair_system_on_object(obj, scene):
     bpy.context.view_layer.objects.active = obj
     obj.select_set(True)
     
-    # Remove any existing hair system
-    for i, psys in enumerate(obj.particle_systems):
-        if psys.name == "StylizedHair":
-            obj.particle_systems.active_index = i
-            bpy.ops.object.particle_system_remove()
-            break
+    # Remove any existing hair system along with its material and weight maps
+    remove_hair_data(obj, 'HAIR')
     
     # Create material
     hair_mat = create_hair_material(
@@ -594,7 +1001,7 @@ def create_hair_system_on_object(obj, scene):
         obj.material_slots[-1].material = hair_mat
     
     # Create vertex groups
-    hair_group, grey_hair_group = distribute_hair_vertices(obj, scene)
+    hair_group, hair_length_group = distribute_hair_vertices(obj, scene)
     
     # Create the hair system
     hair_system = create_hair_system(
@@ -604,7 +1011,7 @@ def create_hair_system_on_object(obj, scene):
         length=scene.hair_length,
         thickness=scene.hair_thickness,
         vertex_group=hair_group,
-        grey_group=grey_hair_group
+        length_group=hair_length_group
     )
     
     # Apply transparency settings
@@ -625,12 +1032,8 @@ def create_stubble_system_on_object(obj, scene):
     bpy.context.view_layer.objects.active = obj
     obj.select_set(True)
     
-    # Remove any existing stubble system
-    for i, psys in enumerate(obj.particle_systems):
-        if psys.name == "StylizedStubble":
-            obj.particle_systems.active_index = i
-            bpy.ops.object.particle_system_remove()
-            break
+    # Remove any existing stubble system along with its material and weight maps
+    remove_hair_data(obj, 'STUBBLE')
     
     # Create material
     stubble_mat = create_hair_material(
@@ -652,7 +1055,7 @@ def create_stubble_system_on_object(obj, scene):
         obj.material_slots[-1].material = stubble_mat
     
     # Create vertex groups
-    stubble_group, grey_stubble_group = distribute_stubble_vertices(obj, scene)
+    stubble_group, stubble_length_group = distribute_stubble_vertices(obj, scene)
     
     # Create the stubble system
     stubble_system = create_hair_system(
@@ -662,7 +1065,7 @@ def create_stubble_system_on_object(obj, scene):
         length=scene.stubble_length,
         thickness=scene.stubble_thickness,
         vertex_group=stubble_group,
-        grey_group=grey_stubble_group
+        length_group=stubble_length_group
     )
     
     # Apply transparency settings
@@ -673,6 +1076,125 @@ def create_stubble_system_on_object(obj, scene):
     
     return stubble_system
 
+# Original render settings saved while camera density scaling is active:
+# ParticleSettings name -> count and (object name, modifier name) -> show_render
+_render_originals = {}
+
+# Fixed render density levels. Changing a hair count re-places its particles,
+# so the factor only changes when an object crosses a level, not every frame.
+RENDER_DENSITY_LEVELS = (0.125, 0.25, 0.5, 1.0)
+
+def quantize_density(factor, min_factor):
+    """Snap a density factor up to the next fixed level, with min_factor as the lowest level"""
+    if factor <= min_factor:
+        return min_factor
+    for level in RENDER_DENSITY_LEVELS:
+        if level >= factor:
+            return max(level, min_factor)
+    return 1.0
+
+def screen_coverage(scene, camera, obj):
+    """Estimate the fraction of the camera frame covered by the object's bounding box"""
+    corners = [world_to_camera_view(scene, camera, obj.matrix_world @ Vector(corner)) for corner in obj.bound_box]
+    
+    # Fully behind the camera
+    if all(co.z <= 0.0 for co in corners):
+        return 0.0
+    
+    # Partly behind the camera: treat as filling the frame
+    if any(co.z <= 0.0 for co in corners):
+        return 1.0
+    
+    min_x = max(0.0, min(co.x for co in corners))
+    max_x = min(1.0, max(co.x for co in corners))
+    min_y = max(0.0, min(co.y for co in corners))
+    max_y = min(1.0, max(co.y for co in corners))
+    
+    if max_x <= min_x or max_y <= min_y:
+        return 0.0
+    return (max_x - min_x) * (max_y - min_y)
+
+def apply_render_density(scene):
+    """Scale render particle amounts of all groomed objects by their screen coverage"""
+    camera = scene.camera
+    if not camera:
+        return
+    
+    # Largest factor per ParticleSettings, so shared settings keep the closest user's density
+    factors = {}
+    for obj in scene.objects:
+        if obj.type != 'MESH':
+            continue
+        
+        coverage = None
+        for mod in obj.modifiers:
+            if mod.type != 'PARTICLE_SYSTEM' or mod.particle_system.name not in ("StylizedHair", "StylizedStubble"):
+                continue
+            
+            if coverage is None:
+                coverage = screen_coverage(scene, camera, obj)
+            
+            settings = mod.particle_system.settings
+            _render_originals.setdefault(settings.name, settings.count)
+            factor = quantize_density(coverage / scene.hair_lod_full_coverage, scene.hair_lod_min_factor)
+            factors[settings.name] = max(factors.get(settings.name, 0.0), factor)
+            
+            # Switch stubble off when it is too small to be seen
+            if mod.particle_system.name == "StylizedStubble":
+                _render_originals.setdefault((obj.name, mod.name), mod.show_render)
+                show = _render_originals[(obj.name, mod.name)] and coverage >= scene.stubble_lod_cutoff
+                set_if_changed(mod, "show_render", show)
+    
+    # Always scale from the original amounts, not from the previous frame
+    for name, factor in factors.items():
+        settings = bpy.data.particles.get(name)
+        count = _render_originals[name]
+        set_if_changed(settings, "count", max(min(1, count), int(round(count * factor))))
+
+def restore_render_density():
+    """Restore the render amounts saved by apply_render_density"""
+    for key, value in _render_originals.items():
+        if isinstance(key, tuple):
+            obj = bpy.data.objects.get(key[0])
+            mod = obj.modifiers.get(key[1]) if obj else None
+            if mod:
+                mod.show_render = value
+        else:
+            settings = bpy.data.particles.get(key)
+            if settings:
+                set_if_changed(settings, "count", value)
+    _render_originals.clear()
+
+def update_render_lod(self, context):
+    """Lock the interface while rendering, so handlers can safely change particle data"""
+    if self.hair_render_lod:
+        self.render.use_lock_interface = True
+
+@persistent
+def render_density_pre(scene, *args):
+    """render_pre handler: scale particle amounts for the frame about to render
+    
+    Particle data is only written with the interface locked, since interactive
+    renders call this from the render job while the UI is still running.
+    """
+    if scene.hair_render_lod:
+        if not scene.render.use_lock_interface:
+            print("Stylized Hair: render density scaling skipped, enable Render > Lock Interface")
+            return
+        apply_render_density(scene)
+
+@persistent
+def render_density_frame_change(scene, *args):
+    """frame_change_pre handler: rescale for the new frame while a render is running"""
+    if _render_originals and scene.hair_render_lod:
+        apply_render_density(scene)
+
+@persistent
+def render_density_post(scene, *args):
+    """render_complete/render_cancel handler: restore the original particle amounts"""
+    if _render_originals:
+        restore_render_density()
+
 # Register classes and properties
 classes = (
     HAIR_PT_Panel,
@@ -792,11 +1314,87 @@ def register():
         update=update_transparency_settings
     )
     
+    # Performance settings for vertex classification on dense meshes
+    bpy.types.Scene.hair_chunk_size = IntProperty(
+        name="Chunk Size",
+        description="Number of vertices processed per chunk when computing weight maps",
+        min=1024,
+        max=16777216,
+        default=DEFAULT_CHUNK_SIZE
+    )
+    
+    bpy.types.Scene.hair_threads = IntProperty(
+        name="Threads",
+        description="Worker threads for computing weight maps (0 = all cores)",
+        min=0,
+        max=64,
+        default=0
+    )
+    
+    # Camera distance based render density
+    bpy.types.Scene.hair_render_lod = BoolProperty(
+        name="Scale by Camera Coverage",
+        description="Reduce render particle amounts for objects covering a small part of the frame. "
+                    "Turns on Lock Interface, which is needed to change particles during a render",
+        default=False,
+        update=update_render_lod
+    )
+    
+    bpy.types.Scene.hair_lod_full_coverage = FloatProperty(
+        name="Full Density Coverage",
+        description="Fraction of the frame an object must cover to render at full density",
+        subtype='FACTOR',
+        min=0.001,
+        max=1.0,
+        default=0.25
+    )
+    
+    bpy.types.Scene.hair_lod_min_factor = FloatProperty(
+        name="Minimum Density",
+        description="Lowest fraction of the particle amount used for distant objects",
+        subtype='FACTOR',
+        min=0.0,
+        max=1.0,
+        default=0.05
+    )
+    
+    bpy.types.Scene.stubble_lod_cutoff = FloatProperty(
+        name="Stubble Cutoff",
+        description="Frame coverage below which stubble is not rendered",
+        subtype='FACTOR',
+        min=0.0,
+        max=1.0,
+        default=0.01
+    )
+    
     # Register classes
     for cls in classes:
         bpy.utils.register_class(cls)
+    
+    # Keep particle systems in sync with the settings after undo/redo
+    bpy.app.handlers.undo_post.append(sync_after_undo)
+    bpy.app.handlers.redo_post.append(sync_after_undo)
+    
+    # Camera distance based render density
+    bpy.app.handlers.render_pre.append(render_density_pre)
+    bpy.app.handlers.frame_change_pre.append(render_density_frame_change)
+    bpy.app.handlers.render_complete.append(render_density_post)
+    bpy.app.handlers.render_cancel.append(render_density_post)
 
 def unregister():
+    # Remove handlers and any pending live update
+    for handlers, handler in ((bpy.app.handlers.undo_post, sync_after_undo),
+                              (bpy.app.handlers.redo_post, sync_after_undo),
+                              (bpy.app.handlers.render_pre, render_density_pre),
+                              (bpy.app.handlers.frame_change_pre, render_density_frame_change),
+                              (bpy.app.handlers.render_complete, render_density_post),
+                              (bpy.app.handlers.render_cancel, render_density_post)):
+        if handler in handlers:
+            handlers.remove(handler)
+    if bpy.app.timers.is_registered(apply_live_updates):
+        bpy.app.timers.unregister(apply_live_updates)
+    _pending_updates.clear()
+    
     # Unregister classes in reverse order
     for cls in reversed(classes):
         bpy.utils.unregister_class(cls)
@@ -815,6 +1413,12 @@ def unregister():
     del bpy.types.Scene.stubble_grey_percentage
     del bpy.types.Scene.transparent_scalp
     del bpy.types.Scene.scalp_opacity
+    del bpy.types.Scene.hair_chunk_size
+    del bpy.types.Scene.hair_threads
+    del bpy.types.Scene.hair_render_lod
+    del bpy.types.Scene.hair_lod_full_coverage
+    del bpy.types.Scene.hair_lod_min_factor
+    del bpy.types.Scene.stubble_lod_cutoff
 
 # Run register() when enabling the addon
 if __name__ == "__main__":